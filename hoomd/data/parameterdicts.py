@@ -23,7 +23,7 @@ from hoomd.error import IncompleteSpecificationError
 
 def _has_str_elems(obj):
     """Returns True if all elements of iterable are str."""
-    return all([isinstance(elem, str) for elem in obj])
+    return all(isinstance(elem, str) for elem in obj)
 
 
 def _is_key_iterable(obj):
@@ -133,10 +133,8 @@ class _SmartTypeIndexer:
         iterable of type strings.
         """
         if isinstance(key, tuple) and len(key) == self.len_key:
-            if any([
-                    not _is_key_iterable(v) and not isinstance(v, str)
-                    for v in key
-            ]):
+            if any(not _is_key_iterable(v) and not isinstance(v, str)
+                   for v in key):
                 raise KeyError("The key {} is not valid.".format(key))
             # convert str to single item list for proper enumeration using
             # product
@@ -70,6 +70,8 @@ class UpdaterBoxMC : public Updater
     */
     void setVolumeParams(pybind11::dict d)
         {
+        const Scalar old_volume_weight = m_volume_weight;
+        const Scalar old_ln_volume_weight = m_ln_volume_weight;
         m_volume_mode = d["mode"].cast<std::string>();
         if (m_volume_mode == "standard")
             {
@@ -89,9 +91,15 @@ class UpdaterBoxMC : public Updater
             {
             throw std::runtime_error("Unknown mode for volume moves");
             }
-        // Calculate aspect ratio
-        computeAspectRatios();
-        updateChangedWeights();
+        // Calculate aspect ratio, only isotropic volume moves use it
+        if (m_volume_weight > 0.0 || m_ln_volume_weight > 0.0)
+            {
+            computeAspectRatios();
+            }
+        if (m_volume_weight != old_volume_weight || m_ln_volume_weight != old_ln_volume_weight)
+            {
+            updateChangedWeights();
+            }
         }
 
     //! Gets parameters for box length moves as a dictionary
@@ -116,12 +124,16 @@ class UpdaterBoxMC : public Updater
     */
     void setLengthParams(pybind11::dict d)
         {
+        const Scalar old_length_weight = m_length_weight;
         m_length_weight = d["weight"].cast<Scalar>();
         pybind11::tuple t = d["delta"];
         m_length_delta[0] = t[0].cast<Scalar>();
         m_length_delta[1] = t[1].cast<Scalar>();
         m_length_delta[2] = t[2].cast<Scalar>();
-        updateChangedWeights();
+        if (m_length_weight != old_length_weight)
+            {
+            updateChangedWeights();
+            }
         }
 
     //! Gets parameters for box shear moves as a dictionary
@@ -155,13 +167,17 @@ class UpdaterBoxMC : public Updater
     */
     void setShearParams(pybind11::dict d)
         {
+        const Scalar old_shear_weight = m_shear_weight;
         m_shear_weight = d["weight"].cast<Scalar>();
         pybind11::tuple t = d["delta"];
         m_shear_delta[0] = t[0].cast<Scalar>();
         m_shear_delta[1] = t[1].cast<Scalar>();
         m_shear_delta[2] = t[2].cast<Scalar>();
         m_shear_reduce = d["reduce"].cast<Scalar>();
-        updateChangedWeights();
+        if (m_shear_weight != old_shear_weight)
+            {
+            updateChangedWeights();
+            }
         }
 
     //! Get parameters for box aspect moves as a dictionary
@@ -184,9 +200,13 @@ class UpdaterBoxMC : public Updater
     */
     void setAspectParams(pybind11::dict d)
         {
+        const Scalar old_aspect_weight = m_aspect_weight;
         m_aspect_weight = d["weight"].cast<Scalar>();
         m_aspect_delta = d["delta"].cast<Scalar>();
-        updateChangedWeights();
+        if (m_aspect_weight != old_aspect_weight)
+            {
+            updateChangedWeights();
+            }
         }
 
     //! Calculate aspect ratios for use in isotropic volume changes
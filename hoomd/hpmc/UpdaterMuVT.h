@@ -98,18 +98,21 @@ template<class Shape> class UpdaterMuVT : public Updater
             {
             throw std::runtime_error("Must transfer at least one type.\n");
             }
-        m_transfer_types.clear();
-        for (auto t : transfer_types)
+        // validate all names before replacing the current list
+        std::vector<unsigned int> ids;
+        ids.reserve(transfer_types.size());
+        for (const auto& t : transfer_types)
             {
-            unsigned int id = this->m_pdata->getTypeByName(t);
-            m_transfer_types.push_back(id);
+            ids.push_back(this->m_pdata->getTypeByName(t));
             }
+        m_transfer_types.swap(ids);
         }
 
     //! Get the list of types transferred
     std::vector<std::string> getTransferTypes()
         {
         std::vector<std::string> transfer_types;
+        transfer_types.reserve(m_transfer_types.size());
         for (auto id : m_transfer_types)
             {
             transfer_types.push_back(this->m_pdata->getNameByType(id));
@@ -36,10 +36,13 @@ template<typename Shape> class UpdaterShape : public Updater
 
     std::vector<Scalar> getParticleVolumes()
         {
+        const unsigned int ntypes = m_ntypes.getNumElements();
+        const auto& params = m_mc->getParams();
         std::vector<Scalar> volumes;
-        for (unsigned int type = 0; type < m_ntypes.getNumElements(); type++)
+        volumes.reserve(ntypes);
+        for (unsigned int type = 0; type < ntypes; type++)
             {
-            detail::MassProperties<Shape> mp(m_mc->getParams()[type]);
+            detail::MassProperties<Shape> mp(params[type]);
             volumes.emplace_back(mp.getVolume());
             }
         return volumes;
@@ -48,16 +51,17 @@ template<typename Shape> class UpdaterShape : public Updater
     Scalar getShapeMoveEnergy(uint64_t timestep)
         {
         Scalar energy = 0.0;
-        ArrayHandle<unsigned int> h_ntypes(m_ntypes, access_location::host, access_mode::readwrite);
+        ArrayHandle<unsigned int> h_ntypes(m_ntypes, access_location::host, access_mode::read);
         ArrayHandle<Scalar> h_det(m_determinant_inertia_tensor,
                                   access_location::host,
-                                  access_mode::readwrite);
+                                  access_mode::read);
+        const auto& params = m_mc->getParams();
         for (unsigned int ndx = 0; ndx < m_ntypes.getNumElements(); ndx++)
             {
             energy += m_move_function->computeEnergy(timestep,
                                                      h_ntypes.data[ndx],
                                                      ndx,
-                                                     m_mc->getParams()[ndx],
+                                                     params[ndx],
                                                      h_det.data[ndx]);
             }
         return energy;
@@ -7,6 +7,8 @@ Set :math:`U_{\\mathrm{external},i}` evaluated in
 `hoomd.hpmc.integrate.HPMCIntegrator` to a hard particle-wall interaction.
 """
 
+import functools
+
 import hoomd
 from hoomd.wall import _WallsMetaList
 from hoomd.data.syncedlist import identity
@@ -15,19 +17,29 @@ from hoomd.logging import log
 from hoomd import hpmc
 
 
+@functools.singledispatch
 def _to_hpmc_cpp_wall(wall):
-    if isinstance(wall, hoomd.wall.Sphere):
-        return hoomd.hpmc._hpmc.SphereWall(wall.radius, wall.origin.to_base(),
-                                           wall.inside)
-    if isinstance(wall, hoomd.wall.Cylinder):
-        return hoomd.hpmc._hpmc.CylinderWall(wall.radius, wall.origin.to_base(),
-                                             wall.axis.to_base(), wall.inside)
-    if isinstance(wall, hoomd.wall.Plane):
-        return hoomd.hpmc._hpmc.PlaneWall(wall.origin.to_base(),
-                                          wall.normal.to_base())
     raise TypeError(f"Unknown wall type encountered {type(wall)}.")
 
 
+@_to_hpmc_cpp_wall.register(hoomd.wall.Sphere)
+def _to_hpmc_cpp_sphere_wall(wall):
+    return hoomd.hpmc._hpmc.SphereWall(wall.radius, wall.origin.to_base(),
+                                       wall.inside)
+
+
+@_to_hpmc_cpp_wall.register(hoomd.wall.Cylinder)
+def _to_hpmc_cpp_cylinder_wall(wall):
+    return hoomd.hpmc._hpmc.CylinderWall(wall.radius, wall.origin.to_base(),
+                                         wall.axis.to_base(), wall.inside)
+
+
+@_to_hpmc_cpp_wall.register(hoomd.wall.Plane)
+def _to_hpmc_cpp_plane_wall(wall):
+    return hoomd.hpmc._hpmc.PlaneWall(wall.origin.to_base(),
+                                      wall.normal.to_base())
+
+
 class _HPMCWallsMetaList(_WallsMetaList):
     """Handle HPMC walls.
 
@@ -168,11 +168,11 @@ class Elastic(ShapeMove):
     def _attach(self):
         integrator = self._simulation.operations.integrator
         if isinstance(integrator, integrate.Ellipsoid):
-            for shape in integrator.shape.values():
-                is_sphere = numpy.allclose((shape["a"], shape["b"], shape["c"]),
-                                           shape["a"])
-                if not is_sphere:
-                    raise ValueError("This updater only works when a=b=c.")
+            abc = numpy.array([(shape["a"], shape["b"], shape["c"])
+                               for shape in integrator.shape.values()],
+                              dtype=float).reshape(-1, 3)
+            if not numpy.allclose(abc, abc[:, :1]):
+                raise ValueError("This updater only works when a=b=c.")
         super()._attach()
 
 
@@ -37,16 +37,17 @@ class _MoveSizeTuneDefinition(mc_move_tune._MCTuneDefinition):
             self.index = ["x", "y", "z"].index(splits[1])
         else:
             self.index = -1
+        # Length moves are counted together with volume moves.
+        if self.attr == "length":
+            self._moves_attr = "volume_moves"
+        else:
+            self._moves_attr = self.attr + "_moves"
 
         self.boxmc = boxmc
         super().__init__(target, domain)
 
     def get_ratio(self):
-        if self.attr.startswith("l"):
-            attr = "volume"
-        else:
-            attr = self.attr
-        return getattr(self.boxmc, attr + "_moves")
+        return getattr(self.boxmc, self._moves_attr)
 
     def _get_x(self):
         x = getattr(self.boxmc, self.attr)["delta"]
@@ -754,9 +754,8 @@ class Clusters(Updater):
 
         cpp_cls_name = "UpdaterClusters"
         cpp_cls_name += integrator.__class__.__name__
-        cpp_cls = getattr(_hpmc, cpp_cls_name)
         use_gpu = (isinstance(self._simulation.device, hoomd.device.GPU)
-                   and (cpp_cls_name + 'GPU') in _hpmc.__dict__)
+                   and hasattr(_hpmc, cpp_cls_name + 'GPU'))
         if use_gpu:
             cpp_cls_name += "GPU"
         cpp_cls = getattr(_hpmc, cpp_cls_name)
@@ -9,7 +9,6 @@ from hoomd.md.force import Force
 from hoomd.data.typeconverter import OnlyTypes
 import hoomd
 import warnings
-import copy
 
 validate_mesh = OnlyTypes(Mesh)
 
@@ -29,7 +28,7 @@ class MeshPotential(Force):
 
     def _add(self, simulation):
         # if mesh was associated with multiple pair forces and is still
-        # attached, we need to deepcopy existing mesh.
+        # attached, we need to copy the existing mesh.
         mesh = self._mesh
         if (not self._attached and mesh._attached
                 and mesh._simulation != simulation):
@@ -38,7 +37,7 @@ class MeshPotential(Force):
                 f" This is happending since the force is moving to a new "
                 f"simulation. To supress the warning explicitly set new mesh.",
                 RuntimeWarning)
-            self._mesh = copy.deepcopy(mesh)
+            self._mesh = mesh._clone()
         # We need to check if the force is added since if it is not then this is
         # being called by a SyncedList object and a disagreement between the
         # simulation and mesh._simulation is an error. If the force is added
@@ -1,15 +1,19 @@
 # Copyright (c) 2009-2022 The Regents of the University of Michigan.
 # Part of HOOMD-blue, released under the BSD 3-Clause License.
 
-import copy as cp
 import hoomd
 import pytest
 import numpy as np
 
+
+def _zip_params(cls, args):
+    """Split a dict of parameter columns into per-case (cls, kwargs)."""
+    keys = tuple(args)
+    return [(cls, dict(zip(keys, row))) for row in zip(*args.values())]
+
+
 _harmonic_args = {'k': [30.0, 25.0, 20.0], 'r0': [1.6, 1.7, 1.8]}
-_harmonic_arg_list = [(hoomd.md.mesh.bond.Harmonic,
-                       dict(zip(_harmonic_args, val)))
-                      for val in zip(*_harmonic_args.values())]
+_harmonic_arg_list = _zip_params(hoomd.md.mesh.bond.Harmonic, _harmonic_args)
 
 _FENE_args = {
     'k': [30.0, 25.0, 20.0],
@@ -18,8 +22,7 @@ _FENE_args = {
     'sigma': [1.1, 1.0, 0.9],
     'delta': [0, 0, 0]
 }
-_FENE_arg_list = [(hoomd.md.mesh.bond.FENEWCA, dict(zip(_FENE_args, val)))
-                  for val in zip(*_FENE_args.values())]
+_FENE_arg_list = _zip_params(hoomd.md.mesh.bond.FENEWCA, _FENE_args)
 
 _Tether_args = {
     'k_b': [5.0, 6.0, 7.0],
@@ -28,8 +31,35 @@ _Tether_args = {
     'l_c0': [1.1, 1.1, 1.3],
     'l_max': [1.3, 1.3, 1.5]
 }
-_Tether_arg_list = [(hoomd.md.mesh.bond.Tether, dict(zip(_Tether_args, val)))
-                    for val in zip(*_Tether_args.values())]
+_Tether_arg_list = _zip_params(hoomd.md.mesh.bond.Tether, _Tether_args)
+
+
+# The triplet is symmetric about the y axis, so the force on each particle
+# follows from the (x, y) force component magnitudes (a, b) on the outer
+# particles: (-a, b), (0, -2b), (a, b).
+_TRIPLET_FORCE_PATTERN = np.array([[-1, 1, 0], [0, -2, 0], [1, 1, 0]],
+                                  dtype=np.float64)
+
+
+def _triplet_forces(components):
+    """Expand per-case (a, b) components into (N, 3, 3) particle forces."""
+    a, b = np.asarray(components, dtype=np.float64).T
+    ab = np.stack([a, b, np.zeros_like(a)], axis=-1)
+    return _TRIPLET_FORCE_PATTERN * ab[:, np.newaxis, :]
+
+
+_harmonic_forces = _triplet_forces([(28.395, 16.393861),
+                                    (27.4125, 15.826614),
+                                    (24.93, 14.393342)])
+_harmonic_energies = np.asarray([17.9172, 20.0385, 20.7168])
+
+_FENE_forces = _triplet_forces([(165.834803, 95.744768), (9.719869, 5.611769),
+                                (-33.483261, -19.331569)])
+_FENE_energies = np.asarray([82.0225, 48.6153, 33.4625])
+
+_Tether_forces = _triplet_forces([(0, 0), (0.036666, 0.021169),
+                                  (5.358389, 3.093667)])
+_Tether_energies = np.asarray([0, 0.000463152, 0.1472802])
 
 
 def get_mesh_bond_and_args():
@@ -37,38 +67,15 @@ def get_mesh_bond_and_args():
 
 
 def get_mesh_bond_args_forces_and_energies():
-    harmonic_forces = [[[-28.395, 16.393861, 0], [0, -32.787722, 0],
-                        [28.395, 16.393861, 0]],
-                       [[-27.4125, 15.826614, 0], [0, -31.653229, 0],
-                        [27.4125, 15.826614, 0]],
-                       [[-24.93, 14.393342, 0], [0, -28.786684, 0],
-                        [24.93, 14.393342, 0]]]
-    harmonic_energies = [17.9172, 20.0385, 20.7168]
-    FENE_forces = [[[-165.834803, 95.744768, 0], [0, -191.489537, 0],
-                    [165.834803, 95.744768, 0]],
-                   [[-9.719869, 5.611769, 0], [0., -11.223537, 0],
-                    [9.719869, 5.611769, 0]],
-                   [[33.483261, -19.331569, 0], [0, 38.663139, 0],
-                    [-33.483261, -19.331569, 0]]]
-    FENE_energies = [82.0225, 48.6153, 33.4625]
-    Tether_forces = [[[0, 0, 0], [0, 0, 0], [0, 0, 0]],
-                     [[-0.036666, 0.021169, 0], [0, -0.042339, 0],
-                      [0.036666, 0.021169, 0]],
-                     [[-5.358389, 3.093667, 0], [0, -6.187334, 0],
-                      [5.358389, 3.093667, 0]]]
-    Tether_energies = [0, 0.000463152, 0.1472802]
-
-    harmonic_args_and_vals = []
-    FENE_args_and_vals = []
-    Tether_args_and_vals = []
-    for i in range(3):
-        harmonic_args_and_vals.append(
-            (*_harmonic_arg_list[i], harmonic_forces[i], harmonic_energies[i]))
-        FENE_args_and_vals.append(
-            (*_FENE_arg_list[i], FENE_forces[i], FENE_energies[i]))
-        Tether_args_and_vals.append(
-            (*_Tether_arg_list[i], Tether_forces[i], Tether_energies[i]))
-    return harmonic_args_and_vals + FENE_args_and_vals + Tether_args_and_vals
+    args_and_vals = []
+    for arg_list, forces, energies in (
+        (_harmonic_arg_list, _harmonic_forces, _harmonic_energies),
+        (_FENE_arg_list, _FENE_forces, _FENE_energies),
+        (_Tether_arg_list, _Tether_forces, _Tether_energies),
+    ):
+        for (cls, kwargs), force, energy in zip(arg_list, forces, energies):
+            args_and_vals.append((cls, kwargs, force, energy))
+    return args_and_vals
 
 
 @pytest.fixture(scope='session')
@@ -76,10 +83,12 @@ def triplet_snapshot_factory(device):
 
     def make_snapshot(d=1.0,
                       theta_deg=60,
-                      particle_types=['A'],
+                      particle_types=('A',),
                       dimensions=3,
                       L=20):
         theta_rad = theta_deg * (np.pi / 180)
+        dx = d * np.sin(theta_rad / 2)
+        dy = d * np.cos(theta_rad / 2)
         s = hoomd.Snapshot(device.communicator)
         N = 3
         if s.communicator.rank == 0:
@@ -89,46 +98,30 @@ def triplet_snapshot_factory(device):
             s.configuration.box = box
             s.particles.N = N
 
-            base_positions = np.array(
-                [[-d * np.sin(theta_rad / 2), d * np.cos(theta_rad / 2), 0.0],
-                 [0.0, 0.0, 0.0],
-                 [d * np.sin(theta_rad / 2), d * np.cos(theta_rad / 2), 0.0]])
+            base_positions = np.array([[-dx, dy, 0.0], [0.0, 0.0, 0.0],
+                                       [dx, dy, 0.0]])
             # move particles slightly in direction of MPI decomposition which
             # varies by simulation dimension
             nudge_dimension = 2 if dimensions == 3 else 1
             base_positions[:, nudge_dimension] += 0.1
             s.particles.position[:] = base_positions
-            s.particles.types = particle_types
+            s.particles.types = list(particle_types)
         return s
 
     return make_snapshot
 
 
-@pytest.mark.parametrize("mesh_bond_cls, potential_kwargs",
-                         get_mesh_bond_and_args())
-def test_before_attaching(mesh_bond_cls, potential_kwargs):
-    mesh = hoomd.mesh.Mesh()
-    mesh_bond_potential = mesh_bond_cls(mesh)
-    mesh_bond_potential.params["mesh"] = potential_kwargs
-
-    assert mesh is mesh_bond_potential.mesh
-    for key in potential_kwargs:
-        np.testing.assert_allclose(mesh_bond_potential.params["mesh"][key],
-                                   potential_kwargs[key],
-                                   rtol=1e-6)
-
-    mesh1 = hoomd.mesh.Mesh()
-    mesh_bond_potential.mesh = mesh1
-    assert mesh1 is mesh_bond_potential.mesh
-
+def _assert_params_equal(mesh_bond_potential, potential_kwargs):
+    params = mesh_bond_potential.params["mesh"]
+    expected = np.concatenate(
+        [np.atleast_1d(potential_kwargs[key]) for key in potential_kwargs])
+    actual = np.concatenate(
+        [np.atleast_1d(params[key]) for key in potential_kwargs])
+    np.testing.assert_allclose(actual, expected, rtol=1e-6)
 
-@pytest.mark.parametrize("mesh_bond_cls, potential_kwargs",
-                         get_mesh_bond_and_args())
-def test_after_attaching(triplet_snapshot_factory, simulation_factory,
-                         mesh_bond_cls, potential_kwargs):
-    snap = triplet_snapshot_factory(d=0.969, L=5)
-    sim = simulation_factory(snap)
 
+def _run_triplet_simulation(sim, mesh_bond_cls, potential_kwargs):
+    """Attach a mesh bond potential over the triplet and run 0 steps."""
     mesh = hoomd.mesh.Mesh()
     mesh.size = 1
     mesh.triangles = [[0, 1, 2]]
@@ -147,10 +140,32 @@ def test_after_attaching(triplet_snapshot_factory, simulation_factory,
     sim.operations.integrator = integrator
 
     sim.run(0)
-    for key in potential_kwargs:
-        np.testing.assert_allclose(mesh_bond_potential.params["mesh"][key],
-                                   potential_kwargs[key],
-                                   rtol=1e-6)
+    return mesh_bond_potential
+
+
+@pytest.mark.parametrize("mesh_bond_cls, potential_kwargs",
+                         get_mesh_bond_and_args())
+def test_before_attaching(mesh_bond_cls, potential_kwargs):
+    mesh = hoomd.mesh.Mesh()
+    mesh_bond_potential = mesh_bond_cls(mesh)
+    mesh_bond_potential.params["mesh"] = potential_kwargs
+
+    assert mesh is mesh_bond_potential.mesh
+    _assert_params_equal(mesh_bond_potential, potential_kwargs)
+
+    mesh1 = hoomd.mesh.Mesh()
+    mesh_bond_potential.mesh = mesh1
+    assert mesh1 is mesh_bond_potential.mesh
+
+
+@pytest.mark.parametrize("mesh_bond_cls, potential_kwargs",
+                         get_mesh_bond_and_args())
+def test_after_attaching(triplet_snapshot_factory, simulation_factory,
+                         mesh_bond_cls, potential_kwargs):
+    sim = simulation_factory(triplet_snapshot_factory(d=0.969, L=5))
+    mesh_bond_potential = _run_triplet_simulation(sim, mesh_bond_cls,
+                                                  potential_kwargs)
+    _assert_params_equal(mesh_bond_potential, potential_kwargs)
 
     mesh1 = hoomd.mesh.Mesh()
     with pytest.raises(RuntimeError):
@@ -161,30 +176,12 @@ def test_after_attaching(triplet_snapshot_factory, simulation_factory,
                          get_mesh_bond_args_forces_and_energies())
 def test_forces_and_energies(triplet_snapshot_factory, simulation_factory,
                              mesh_bond_cls, potential_kwargs, force, energy):
-    snap = triplet_snapshot_factory(d=0.969, L=5)
-    sim = simulation_factory(snap)
-
-    mesh = hoomd.mesh.Mesh()
-    mesh.size = 1
-    mesh.triangles = [[0, 1, 2]]
-
-    mesh_bond_potential = mesh_bond_cls(mesh)
-    mesh_bond_potential.params["mesh"] = potential_kwargs
-
-    integrator = hoomd.md.Integrator(dt=0.005)
-
-    integrator.forces.append(mesh_bond_potential)
-
-    langevin = hoomd.md.methods.Langevin(kT=1,
-                                         filter=hoomd.filter.All(),
-                                         alpha=0.1)
-    integrator.methods.append(langevin)
-    sim.operations.integrator = integrator
+    sim = simulation_factory(triplet_snapshot_factory(d=0.969, L=5))
+    mesh_bond_potential = _run_triplet_simulation(sim, mesh_bond_cls,
+                                                  potential_kwargs)
 
-    sim.run(0)
-
-    sim_energies = sim.operations.integrator.forces[0].energies
-    sim_forces = sim.operations.integrator.forces[0].forces
+    sim_energies = mesh_bond_potential.energies
+    sim_forces = mesh_bond_potential.forces
     if sim.device.communicator.rank == 0:
         np.testing.assert_allclose(sum(sim_energies),
                                    energy,
@@ -228,8 +225,9 @@ def test_auto_detach_simulation(simulation_factory, mesh_snapshot_factory):
     harmonic = hoomd.md.mesh.bond.Harmonic(mesh)
     harmonic.params["mesh"] = dict(k=1, r0=1)
 
-    harmonic_2 = cp.deepcopy(harmonic)
-    harmonic_2.mesh = mesh
+    # A second, independent force that shares only the mesh.
+    harmonic_2 = hoomd.md.mesh.bond.Harmonic(mesh)
+    harmonic_2.params["mesh"] = dict(k=1, r0=1)
 
     integrator = hoomd.md.Integrator(dt=0.005, forces=[harmonic, harmonic_2])
 
@@ -244,3 +242,43 @@ def test_auto_detach_simulation(simulation_factory, mesh_snapshot_factory):
     del integrator.forces[0]
     assert not mesh._attached
     assert mesh._cpp_obj is None
+
+
+def test_move_to_new_simulation(simulation_factory, mesh_snapshot_factory):
+    sim = simulation_factory(mesh_snapshot_factory(d=0.969, L=5))
+    mesh = hoomd.mesh.Mesh()
+    mesh.triangles = [[0, 1, 2], [0, 2, 3]]
+
+    harmonic = hoomd.md.mesh.bond.Harmonic(mesh)
+    harmonic.params["mesh"] = dict(k=1, r0=1)
+    harmonic_2 = hoomd.md.mesh.bond.Harmonic(mesh)
+    harmonic_2.params["mesh"] = dict(k=1, r0=1)
+
+    integrator = hoomd.md.Integrator(dt=0.005, forces=[harmonic, harmonic_2])
+    integrator.methods.append(
+        hoomd.md.methods.Langevin(kT=1, filter=hoomd.filter.All()))
+    sim.operations.integrator = integrator
+    sim.run(0)
+
+    # harmonic keeps the mesh attached to the first simulation, so moving
+    # harmonic_2 must give it a new mesh.
+    del integrator.forces[1]
+    assert mesh._attached
+
+    sim_2 = simulation_factory(mesh_snapshot_factory(d=0.969, L=5))
+    integrator_2 = hoomd.md.Integrator(dt=0.005, forces=[harmonic_2])
+    integrator_2.methods.append(
+        hoomd.md.methods.Langevin(kT=1, filter=hoomd.filter.All()))
+    with pytest.warns(RuntimeWarning, match="new equivalent mesh"):
+        sim_2.operations.integrator = integrator_2
+    sim_2.run(0)
+
+    new_mesh = harmonic_2.mesh
+    assert new_mesh is not mesh
+    assert new_mesh._attached
+    assert new_mesh.types == mesh.types
+    np.testing.assert_array_equal(new_mesh.triangles, mesh.triangles)
+
+    del integrator_2.forces[0]
+    assert not new_mesh._attached
+    assert mesh._attached
@@ -100,6 +100,17 @@ class Mesh(_HOOMDBaseObject):
             if self._added:
                 self._remove()
 
+    def _clone(self):
+        """Create an unattached mesh with the same types and triangulation.
+
+        Unlike `copy.deepcopy`, this does not copy the dependents (the mesh
+        potentials) of the mesh.
+        """
+        mesh = Mesh()
+        mesh.types = list(self.types)
+        mesh.triangles = np.array(self.triangles, copy=True)
+        return mesh
+
     @log(category='sequence')
     def triangles(self):
         """((*N*, 3) `numpy.ndarray` of ``uint32``): Mesh triangulation.
@@ -95,3 +95,21 @@ def test_mesh_setter_attached(simulation_factory, mesh_snapshot_factory):
     assert numpy.array_equal(mesh.triangles, mesh_triangles)
     assert numpy.array_equal(
         mesh.bonds, numpy.array([[0, 1], [1, 2], [2, 0], [2, 3], [3, 1]]))
+
+
+def test_mesh_clone(simulation_factory, mesh_snapshot_factory):
+    sim = simulation_factory(mesh_snapshot_factory(d=0.969, L=5))
+    mesh = Mesh()
+    mesh.types = ["vesicle"]
+    mesh.triangles = numpy.array([[0, 1, 2], [1, 2, 3]])
+
+    mesh._add(sim)
+    mesh._attach()
+
+    clone = mesh._clone()
+
+    assert not clone._added
+    assert not clone._attached
+    assert clone.size == 2
+    assert clone.types[0] == "vesicle"
+    assert numpy.array_equal(clone.triangles, mesh.triangles)
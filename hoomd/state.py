@@ -661,28 +661,32 @@ class State:
     def domain_decomposition_split_fractions(self):
         """tuple(list[float], list[float], list[float]): Box fractions of the \
         domain split planes in the x, y, and z directions."""
-        particle_data = self._cpp_sys_def.getParticleData()
+        if not hoomd.version.mpi_enabled:
+            return ([], [], [])
 
-        if (not hoomd.version.mpi_enabled
-                or particle_data.getDomainDecomposition() is None):
+        decomposition = self._cpp_sys_def.getParticleData(
+        ).getDomainDecomposition()
+        if decomposition is None:
             return ([], [], [])
 
         return tuple([
-            list(particle_data.getDomainDecomposition().getCumulativeFractions(
-                dir))[1:-1] for dir in range(3)
+            list(decomposition.getCumulativeFractions(dir))[1:-1]
+            for dir in range(3)
         ])
 
     @property
     def domain_decomposition(self):
         """tuple(int, int, int): Number of domains in the x, y, and z \
         directions."""
-        particle_data = self._cpp_sys_def.getParticleData()
+        if not hoomd.version.mpi_enabled:
+            return (1, 1, 1)
 
-        if (not hoomd.version.mpi_enabled
-                or particle_data.getDomainDecomposition() is None):
+        decomposition = self._cpp_sys_def.getParticleData(
+        ).getDomainDecomposition()
+        if decomposition is None:
             return (1, 1, 1)
 
         return tuple([
-            len(particle_data.getDomainDecomposition().getCumulativeFractions(
-                dir)) - 1 for dir in range(3)
+            len(decomposition.getCumulativeFractions(dir)) - 1
+            for dir in range(3)
         ])